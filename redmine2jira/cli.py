@@ -4,9 +4,8 @@
 
 from __future__ import absolute_import
 
-from functools import reduce
 from itertools import chain
-from operator import and_, itemgetter
+from operator import itemgetter
 
 import click
 
@@ -14,7 +13,7 @@ from click_default_group import DefaultGroup
 from redminelib import Redmine
 from redminelib.resultsets import ResourceSet
 from six import text_type
-from six.moves.urllib.parse import unquote
+from six.moves.urllib.parse import parse_qsl
 from tabulate import tabulate
 
 from redmine2jira import config
@@ -48,10 +47,14 @@ def export_issues(output, query_string):
     else:
         issues = _get_all_issues()
 
+    # Counting the issues fetches all of them at once,
+    # hence they are counted only once.
+    issues_count = len(issues)
+
     click.echo("{:d} issue{} found!"
-               .format(len(issues), "s" if len(issues) > 1 else ""))
+               .format(issues_count, "s" if issues_count > 1 else ""))
 
-    exporter.export(issues)
+    exporter.export(issues, output)
 
     click.echo("Issues exported in '{}'!".format(output.name))
     click.echo()
@@ -69,9 +72,7 @@ def _get_issues_by_filter(query_string):
     """
     # Split filters written in URL query string syntax,
     # URL decoding parameters values
-    filters = {k: unquote(v)
-               for k, v in zip(*[iter([kv for p in query_string.split('&')
-                                       for kv in p.split('=')])] * 2)}
+    filters = dict(parse_qsl(query_string, keep_blank_values=True))
 
     issues = redmine.issue.filter(**filters)
 
@@ -166,6 +167,10 @@ def list_projects():
 
     projects = redmine.project.all()
 
+    # Projects by ID, so that parent projects are fetched from Redmine
+    # only if they are not among the listed ones, and only once.
+    projects_by_id = {project.id: project for project in projects}
+
     def get_project_full_name(project, full_name):
         """
         Build the full name of the project including hierarchy information.
@@ -181,7 +186,13 @@ def list_projects():
             full_name = project.name
 
         if hasattr(project, 'parent'):
-            parent = redmine.project.get(project.parent.id)
+            parent_id = project.parent.id
+            parent = projects_by_id.get(parent_id, None)
+
+            if parent is None:
+                parent = redmine.project.get(parent_id)
+                projects_by_id[parent_id] = parent
+
             full_name = get_project_full_name(parent, full_name)
 
         return full_name
@@ -262,14 +273,24 @@ def list_versions(project_id):
 
 def _list_resources(resource_set, sort_key,
                     format_dict=None, exclude_attrs=None):
+    # Read the attributes of each resource only once, as both finding
+    # the common attributes and building the table need them.
+    # This also allows the resource set to be a one-shot iterator.
+    resources_attributes = [
+        (resource, {a: getattr(resource, a) for a in dir(resource)})
+        for resource in resource_set
+    ]
+
     # Find resource attributes excluding relations with other resource types
     scalar_attributes = \
-        (set((a for a in dir(resource)
-              if not isinstance(getattr(resource, a), ResourceSet)))
-         for resource in resource_set)
-
-    # Compute a common subset among all the scalar attributes
-    common_scalar_attributes = reduce(and_, scalar_attributes)
+        (set((a for a, v in attributes.items()
+              if not isinstance(v, ResourceSet)))
+         for resource, attributes in resources_attributes)
+
+    # Compute a common subset among all the scalar attributes,
+    # intersecting the first set with all the others at once
+    common_scalar_attributes = \
+        next(scalar_attributes, set()).intersection(*scalar_attributes)
     # Declare base headers for all resource types
     base_headers = ['id']
 
@@ -288,8 +309,8 @@ def _list_resources(resource_set, sort_key,
     headers = \
         base_headers + sorted(common_scalar_attributes - set(base_headers))
 
-    def _format(key, resource):
-        value = getattr(resource, key)
+    def _format(key, resource, attributes):
+        value = attributes[key]
 
         if format_dict and key in format_dict:
             return format_dict[key](resource, value)
@@ -299,8 +320,9 @@ def _list_resources(resource_set, sort_key,
     # Build a "table" (list of dictionaries)
     # from all the resource instances,
     # using only the calculated attributes
-    resource_table = sorted(({h: _format(h, resource) for h in headers}
-                             for resource in resource_set),
+    resource_table = sorted(({h: _format(h, resource, attributes)
+                              for h in headers}
+                             for resource, attributes in resources_attributes),
                             key=itemgetter(sort_key))
 
     # Pretty print the resource table
@@ -335,10 +335,18 @@ ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS = False
 
 
 # Overrides default settings with user defined ones, if any...
+#
+# The presence of the local configuration module is checked upfront,
+# rather than importing it and catching the ImportError, so that the
+# common case of a missing file doesn't go through exception handling.
 try:
-    from redmine2jira.config_local import *  # noqa
+    from importlib.util import find_spec as _find_spec
 except ImportError:
-    pass
+    # Python 2
+    from pkgutil import find_loader as _find_spec
+
+if _find_spec('redmine2jira.config_local') is not None:
+    from redmine2jira.config_local import *  # noqa
 
 
 # Compose Redmine URL...
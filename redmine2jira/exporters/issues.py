@@ -12,15 +12,20 @@ try:
 except ImportError:
     from contextlib2 import suppress
 
-from datetime import datetime, timedelta
-from itertools import chain
-from operator import itemgetter
+import json
+import tempfile
+
+from collections import OrderedDict, defaultdict
+from contextlib import closing
+from datetime import datetime
+from itertools import chain, islice
+from multiprocessing.pool import ThreadPool
+from operator import attrgetter, itemgetter
 
 import click
 
 from click.exceptions import ClickException, UsageError
 from inflection import humanize, underscore
-from isodate import duration_isoformat
 from redminelib import Redmine
 from redminelib.exceptions import ForbiddenError
 
@@ -31,8 +36,7 @@ from redmine2jira.resources.mappings import (
     RESOURCE_TYPE_MAPPINGS_BY_PROJECT,
     RESOURCE_TYPE_IDENTIFYING_FIELD_MAPPINGS,
     ISSUE_CUSTOM_FIELD_TYPE_MAPPINGS,
-    ISSUE_FIELD_MAPPINGS,
-    ResourceTypeMapping
+    ISSUE_FIELD_MAPPINGS
 )
 from redmine2jira.utils.text import text2confluence_wiki
 
@@ -42,8 +46,122 @@ from redmine2jira.utils.text import text2confluence_wiki
 ##################
 
 MISSING_RESOURCE_MAPPINGS_MESSAGE = "Resource value mappings definition"
+MISSING_RESOURCE_MAPPINGS_RULE = "-" * len(MISSING_RESOURCE_MAPPINGS_MESSAGE)
+MISSING_RESOURCE_MAPPINGS_HEADER = "\n".join([
+    "",
+    MISSING_RESOURCE_MAPPINGS_RULE,
+    MISSING_RESOURCE_MAPPINGS_MESSAGE,
+    MISSING_RESOURCE_MAPPINGS_RULE
+])
 MISSING_RESOURCE_MAPPING_PROMPT_SUFFIX = " -> "
 
+# Issue child resources fetched along with each issue in a single request.
+#
+# NOTE: The Redmine REST API allows to include journals and watchers
+#       only when fetching a single issue, not when listing issues.
+ISSUE_INCLUDES = 'attachments,journals,watchers'
+
+# Sort order of journal details property types
+# among journal details referring to the same name.
+JOURNAL_DETAIL_PROPERTY_TYPES_ORDER = {'attr': 0, 'cf': 1}
+
+# Maximum number of HTTP requests sent concurrently to Redmine
+# while fetching resources on a per-project basis.
+MAX_CONCURRENT_REQUESTS = 16
+
+# Maximum number of text contents converted to Confluence Wiki notation
+# kept in memory to be reused whenever the same text content recurs.
+TEXT_CONVERSIONS_CACHE_SIZE = 4096
+
+
+#########################
+# Resource type lookups #
+#########################
+
+# Internal Redmine resource types by RedmineLib resource class name
+REDMINE_RESOURCE_TYPES_BY_CLASS_NAME = {
+    name[len('Redmine'):]: resource_type
+    for name, resource_type in vars(models).items()
+    if name.startswith('Redmine') and isinstance(resource_type, type)
+}
+
+# Resource type mappings, paired with their identifying field mappings,
+# by Redmine resource type and Jira resource type.
+#
+# NOTE: Resource type mappings are stored to be reused as they are,
+#       rather than being rebuilt from the two resource types each time
+#       they are needed, e.g. as part of the resource value mappings keys.
+IDENTIFYING_FIELD_MAPPINGS_BY_REDMINE_RESOURCE_TYPE = dict()
+
+for _rtp, _field_mapping in RESOURCE_TYPE_IDENTIFYING_FIELD_MAPPINGS.items():
+    IDENTIFYING_FIELD_MAPPINGS_BY_REDMINE_RESOURCE_TYPE \
+        .setdefault(_rtp.redmine, dict())[_rtp.jira] = (_rtp, _field_mapping)
+
+del _rtp, _field_mapping
+
+# Names of the configuration settings holding the static resource value
+# mappings, by resource type mapping
+RESOURCE_TYPE_MAPPING_SETTING_NAMES = {
+    rtp: '{}_{}_MAPPINGS'.format(underscore(rtp.redmine.__name__).upper(),
+                                 underscore(rtp.jira.__name__).upper())
+    for rtp in ALL_RESOURCE_TYPE_MAPPINGS
+}
+
+# Internal Redmine issue field definitions by name of the attribute
+# they are referenced by in journal details, i.e. the foreign key name
+# for fields referring to issue related resources
+REDMINE_ISSUE_FIELDS_BY_ATTRIBUTE_NAME = {
+    field.key + '_id' if field.is_relation else field.key: field
+    for field in vars(models.RedmineIssue).values()
+    if isinstance(field, models.Field)
+}
+
+# Names of the Redmine issue standard attributes, as referenced in journal
+# details, which have no counterpart among the Jira issue fields
+UNMAPPED_REDMINE_ISSUE_ATTRIBUTE_NAMES = frozenset(
+    name for name, field in REDMINE_ISSUE_FIELDS_BY_ATTRIBUTE_NAME.items()
+    if field in ISSUE_FIELD_MAPPINGS and ISSUE_FIELD_MAPPINGS[field] is None
+)
+
+# Humanized names of resource types by resource type class
+# and class name prefix to strip, filled in as they are needed
+HUMANIZED_RESOURCE_TYPE_NAMES = dict()
+
+
+def humanize_resource_type(resource_type, prefix=''):
+    """
+    Get the human readable name of a resource type.
+
+    :param resource_type: Internal resource type class
+    :param prefix: Prefix to strip from the class name, if any
+    :return: Human readable name of the resource type
+    """
+    try:
+        return HUMANIZED_RESOURCE_TYPE_NAMES[(resource_type, prefix)]
+    except KeyError:
+        humanized_name = \
+            humanize(underscore(resource_type.__name__[len(prefix):]))
+        HUMANIZED_RESOURCE_TYPE_NAMES[(resource_type, prefix)] = \
+            humanized_name
+
+        return humanized_name
+
+
+def parse_id_unique_name(value):
+    """
+    Parse a resource value mapping expressed in the
+    ``{ID}:{identifying_name}`` form.
+
+    :param value: Resource value mapping typed by the final user
+    :return: ``ResourceKey`` object
+    """
+    try:
+        return models.ResourceKey._make(value.split(':'))  # noqa
+    except TypeError:
+        raise UsageError(
+            "The mapping has to be expressed using the "
+            "{ID}:{identifying_name} form!")
+
 
 class IssuesExporter(object):
     """
@@ -57,36 +175,69 @@ class IssuesExporter(object):
 
         redmine = Redmine(config.REDMINE_URL, key=config.REDMINE_API_KEY)
 
+        self._redmine = redmine
+
         # Get all Redmine users, groups, projects, trackers, issue statuses,
-        # issue priorities, issue custom fields and store them by ID
+        # issue priorities, issue custom fields and store them by ID.
+        #
+        # As each resource set needs at least one HTTP request, and they
+        # don't depend on each other, they are all fetched concurrently.
+        resource_set_fetchers = [
+            lambda: redmine.user.all(),
+            lambda: redmine.user.filter(status=3),
+            lambda: (redmine.group.all()
+                     if config.ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS else []),
+            lambda: redmine.project.all(include='issue_categories'),
+            lambda: redmine.tracker.all(),
+            lambda: redmine.issue_status.all(),
+            lambda: redmine.enumeration.filter(resource='issue_priorities'),
+            lambda: redmine.custom_field.all()
+        ]
+
+        with closing(ThreadPool(len(resource_set_fetchers))) as pool:
+            (active_users, locked_users, groups, projects, trackers,
+             issue_statuses, issue_priorities, custom_fields) = \
+                pool.map(lambda fetch: list(fetch()), resource_set_fetchers)
 
         self._users = {user.id: user
-                       for user in chain(redmine.user.all(),
-                                         redmine.user.filter(status=3))}
+                       for user in chain(active_users, locked_users)}
 
         self._groups = None
 
         if config.ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS:
-            self._groups = {group.id: group for group in redmine.group.all()}
+            self._groups = {group.id: group for group in groups}
 
-        self._projects = \
-            {project.id: project
-             for project in redmine.project.all(include='issue_categories')}
+        self._projects = {project.id: project for project in projects}
 
-        self._trackers = {tracker.id: tracker
-                          for tracker in redmine.tracker.all()}
+        self._trackers = {tracker.id: tracker for tracker in trackers}
 
         self._issue_statuses = {issue_status.id: issue_status
-                                for issue_status in redmine.issue_status.all()}
+                                for issue_status in issue_statuses}
+
+        self._issue_priorities = {issue_priority.id: issue_priority
+                                  for issue_priority in issue_priorities}
 
-        self._issue_priorities = {
-            issue_priority.id: issue_priority
-            for issue_priority in
-            redmine.enumeration.filter(resource='issue_priorities')}
+        self._issue_custom_fields = {cf.id: cf for cf in custom_fields
+                                     if cf.customized_type == 'issue'}
+
+        # Store the IDs of multi-valued issue custom fields, as the
+        # "multiple" property is returned only for custom fields whose
+        # format allows it.
+        self._multiple_issue_custom_fields = {
+            cf.id for cf in self._issue_custom_fields.values()
+            if getattr(cf, 'multiple', False)
+        }
 
-        self._issue_custom_fields = \
-            {cf.id: cf for cf in redmine.custom_field.all()
-             if cf.customized_type == 'issue'}
+        # Resolve the Jira field type of each issue custom field upfront,
+        # as it only depends on the custom field definition.
+        # Custom fields which format is not supported are left out.
+        self._issue_custom_field_types = {
+            cf_id: ISSUE_CUSTOM_FIELD_TYPE_MAPPINGS[cf.field_format][
+                'multiple' if cf_id in self._multiple_issue_custom_fields
+                else 'single']
+            for cf_id, cf in self._issue_custom_fields.items()
+            if cf.field_format in ISSUE_CUSTOM_FIELD_TYPE_MAPPINGS
+        }
 
         # Get all Redmine issue categories and versions
         # and store them by project ID and, respectively,
@@ -103,16 +254,61 @@ class IssuesExporter(object):
         # To build versions dictionary on a per project basis
         # we need to ignore 403 errors for projects where
         # no versions have been defined yet.
-        self._versions = dict()
-
-        for project in self._projects.values():
-            self._versions[project.id] = dict()
-
+        #
+        # As versions need an HTTP request per project,
+        # they are fetched concurrently for several projects.
+        def get_project_versions(project):
             with suppress(ForbiddenError):
-                for version in project.versions:
-                    self._versions[project.id][version.id] = version
+                return project.id, {version.id: version
+                                    for version in project.versions}
+
+            return project.id, dict()
+
+        with closing(ThreadPool(max(1, min(len(self._projects),
+                                           MAX_CONCURRENT_REQUESTS)))) as pool:
+            self._versions = dict(pool.map(get_project_versions,
+                                           self._projects.values()))
+
+        # Resolvers of the resource instances referenced by the issue
+        # attributes in journal details, by attribute name
+        self._journal_detail_attribute_resolvers = {
+            'project_id':
+                lambda value, project_id: self._projects.get(value, None),
+            'tracker_id':
+                lambda value, project_id: self._trackers.get(value, None),
+            'author_id':
+                lambda value, project_id: self._users.get(value, None),
+            'assigned_to_id':
+                lambda value, project_id:
+                    self._get_assignee(value, required=False),
+            'status_id':
+                lambda value, project_id:
+                    self._issue_statuses.get(value, None),
+            'priority_id':
+                lambda value, project_id:
+                    self._issue_priorities.get(value, None),
+            'category_id':
+                lambda value, project_id:
+                    self._issue_categories[project_id].get(value, None),
+            'fixed_version_id':
+                lambda value, project_id:
+                    self._versions[project_id].get(value, None)
+        }
 
+        # Text contents need to be converted to Confluence Wiki notation
+        # only if a markup language is used for text fields.
+        self._text_formatting_enabled = \
+            config.REDMINE_TEXT_FORMATTING != 'none'
+
+        self._static_resource_value_mappings = dict()
         self._resource_value_mappings = None
+        self._resource_mappings_cache = None
+        self._project_exports = None
+        self._issues_spool = None
+        self._project_issues_spans = None
+        self._project_components = None
+        self._journal_detail_mappings_cache = None
+        self._text_conversions_cache = dict()
 
     @staticmethod
     def _validate_config():
@@ -121,20 +317,20 @@ class IssuesExporter(object):
         # the latter has been enabled.
         if config.EXPORT_ISSUE_JOURNALS:
             for rtp in ALL_RESOURCE_TYPE_MAPPINGS:
-                rtp_setting_name = \
-                    '{}_{}_MAPPINGS'.format(
-                        underscore(rtp.redmine.__name__).upper(),
-                        underscore(rtp.jira.__name__).upper())
-
-                static_rvp = getattr(config, rtp_setting_name, {})
-
-                if (rtp in RESOURCE_TYPE_MAPPINGS_BY_PROJECT and
-                    not all((isinstance(v, tuple) and len(v) == 2
-                             for rvp_by_project in static_rvp.values()
-                             for v in rvp_by_project.values()))) or \
-                   (rtp not in RESOURCE_TYPE_MAPPINGS_BY_PROJECT and
-                    not all((isinstance(v, tuple) and len(v) == 2
-                             for v in static_rvp.values()))):
+                static_rvp = getattr(
+                    config, RESOURCE_TYPE_MAPPING_SETTING_NAMES[rtp], {})
+
+                # Resource value mappings defined on a per-project basis
+                # are flattened before being checked all at once
+                if rtp in RESOURCE_TYPE_MAPPINGS_BY_PROJECT:
+                    static_values = chain.from_iterable(
+                        rvp_by_project.values()
+                        for rvp_by_project in static_rvp.values())
+                else:
+                    static_values = static_rvp.values()
+
+                if not all(isinstance(v, tuple) and len(v) == 2
+                           for v in static_values):
                     raise ClickException(
                         "As issues journal export feature "
                         "has been enabled in configuration,\n"
@@ -147,7 +343,7 @@ class IssuesExporter(object):
                         "the specific Jira resource instance,\n"
                         "are its internal ID and its unique identifying name.")
 
-    def export(self, issues):
+    def export(self, issues, output):
         """
         Export issues and their relations to a JSON file which structure is
         compatible with the JIRA Importers plugin (JIM).
@@ -181,82 +377,238 @@ class IssuesExporter(object):
         resources (watchers, attachments, journal entries, time entries),
         groups references can only be found in the "assignee" field.
 
+        In order to keep memory usage low regardless of the number of
+        issues, each issue is serialized as soon as it has been exported,
+        and spooled to a single temporary file, keeping track of the issues
+        spooled for each project. The final JSON file is assembled from the
+        spooled issues once all of them have been exported.
+
         :param issues: Issues to export
+        :param output: File-like object to write the JSON export to
         """
-        issues_export = dict()
         self._resource_value_mappings = dict()
+        self._resource_mappings_cache = dict()
+        self._project_exports = OrderedDict()
+        self._issues_spool = tempfile.TemporaryFile()
+        self._project_issues_spans = dict()
+        self._project_components = dict()
+        self._journal_detail_mappings_cache = dict()
 
-        for issue in issues:
-            # The issue project must be saved before everything else.
-            # That's because all the issues entities must be children of a
-            # project entity in the export dictionary.
-            project_export = self._save_project(issue.project, issues_export)
+        self._define_resource_mappings(issues)
+
+        # Optional issue attributes are fetched only once, using this
+        # placeholder to tell missing attributes apart from null ones.
+        missing = object()
+
+        try:
+            for issue in self._refresh_issues(issues):
+                project = issue.project
+                project_id = project.id
+
+                # The issue project must be saved before everything else.
+                # That's because all the issues entities must be children of a
+                # project entity in the export dictionary.
+                project_export = self._save_project(project)
+
+                # Create new empty issue dictionary
+                issue_export = dict()
+
+                # Save required standard fields
+                self._save_id(issue.id, issue_export)
+                self._save_subject(issue.subject, issue_export)
+                self._save_author(issue.author, issue_export)
+                self._save_tracker(issue.tracker, issue_export)
+                self._save_status(issue.status, issue_export)
+                self._save_priority(issue.priority, issue_export)
+                self._save_created_on(issue.created_on, issue_export)
+                self._save_updated_on(issue.updated_on, issue_export)
+
+                # Save optional standard fields
+                description = getattr(issue, 'description', missing)
+
+                if description is not missing:
+                    self._save_description(description, issue_export)
+
+                assigned_to = getattr(issue, 'assigned_to', missing)
+
+                if assigned_to is not missing:
+                    self._save_assigned_to(assigned_to, issue_export)
+
+                category = getattr(issue, 'category', missing)
+
+                if category is not missing:
+                    self._save_category(category, project_id,
+                                        project_export, issue_export)
+
+                estimated_hours = getattr(issue, 'estimated_hours', missing)
+
+                if estimated_hours is not missing:
+                    self._save_estimated_hours(estimated_hours, issue_export)
+
+                # Save custom fields
+                custom_fields = getattr(issue, 'custom_fields', None)
+
+                if custom_fields is not None:
+                    self._save_custom_fields(custom_fields, project_id,
+                                             issue_export)
+
+                # Save related resources
+                self._save_watchers(issue.watchers, issue_export)
+                self._save_attachments(issue.attachments, issue_export)
+                self._save_journals(issue, project_id, issue_export)
+                self._save_time_entries(issue.time_entries)
 
-            # Create and append new empty issue dictionary
-            # to project issues list
-            issue_export = dict()
-            project_export['issues'].append(issue_export)
+                # TODO Save sub-tasks
 
-            # Save required standard fields
-            self._save_id(issue.id, issue_export)
-            self._save_subject(issue.subject, issue_export)
-            self._save_author(issue.author, issue_export)
-            self._save_tracker(issue.tracker, issue_export)
-            self._save_status(issue.status, issue_export)
-            self._save_priority(issue.priority, issue_export)
-            self._save_created_on(issue.created_on, issue_export)
-            self._save_updated_on(issue.updated_on, issue_export)
+                # TODO Save relations
 
-            # Save optional standard fields
-            if hasattr(issue, 'description'):
-                self._save_description(issue.description, issue_export)
+                # Spool the issue to the parent project issues, so that
+                # the issue export dictionary can be released right away
+                self._spool_issue(issue_export, project_export)
 
-            if hasattr(issue, 'assigned_to'):
-                self._save_assigned_to(issue.assigned_to, issue_export)
+            self._write_export(output)
+        finally:
+            self._issues_spool.close()
 
-            if hasattr(issue, 'category'):
-                self._save_category(issue.category, issue.project.id,
-                                    project_export, issue_export)
+    def _refresh_issues(self, issues):
+        """
+        Fetch all the child resources of each issue at once, rather than
+        lazily fetching each of them on first access.
+
+        As each issue needs an HTTP request, issues are refreshed
+        concurrently in batches, so that only a bounded number of fully
+        fetched issues is held in memory at any time.
 
-            if hasattr(issue, 'estimated_hours'):
-                self._save_estimated_hours(issue.estimated_hours, issue_export)
+        :param issues: Issues to export
+        :return: Generator of refreshed issues, in the original order
+        """
+        def refresh_issue(issue):
+            # NOTE: RedmineLib resource managers store the URL of the
+            #       request being performed, hence they cannot be shared
+            #       among threads. Each issue is then fetched again via
+            #       its own resource manager, rather than being refreshed
+            #       via the one shared by all the issues in the set.
+            return self._redmine.issue.get(issue.id, include=ISSUE_INCLUDES)
 
-            # Save custom fields
-            if hasattr(issue, 'custom_fields'):
-                self._save_custom_fields(issue.custom_fields, issue.project.id,
-                                         issue_export)
+        issues = iter(issues)
 
-            # Save related resources
-            self._save_watchers(issue.watchers, issue_export)
-            self._save_attachments(issue.attachments, issue_export)
-            self._save_journals(issue, issue_export)
-            self._save_time_entries(issue.time_entries)
+        with closing(ThreadPool(MAX_CONCURRENT_REQUESTS)) as pool:
+            while True:
+                issues_batch = list(islice(issues, MAX_CONCURRENT_REQUESTS))
 
-            # TODO Save sub-tasks
+                if not issues_batch:
+                    break
 
-            # TODO Save relations
+                for issue in pool.map(refresh_issue, issues_batch):
+                    yield issue
 
-    def _save_project(self, project, issues_export):
+    def _define_resource_mappings(self, issues):
+        """
+        Resolve upfront the mappings of the resources directly referenced
+        by the issues standard fields, before starting the actual export.
+
+        This way the final user is prompted for most of the missing
+        mappings in a single contiguous block, instead of having the
+        prompts interleaved with the requests performed by the export
+        loop to fetch the issues child resources. The resolved mappings
+        are cached, hence the export loop will just look them up.
+
+        The mappings of the resources referenced by the issues child
+        resources (e.g. watchers, journals) and custom fields are still
+        resolved lazily, as they can only be known after having fetched
+        them.
+
+        :param issues: Issues to export
+        """
+        for issue in issues:
+            project_id = issue.project.id
+
+            self._get_project_mapping(self._projects[project_id])
+            self._get_author_mapping(self._users[issue.author.id])
+            self._get_tracker_mapping(self._trackers[issue.tracker.id])
+            self._get_status_mapping(self._issue_statuses[issue.status.id])
+            self._get_priority_mapping(
+                self._issue_priorities[issue.priority.id])
+
+            assigned_to = getattr(issue, 'assigned_to', None)
+
+            if assigned_to is not None:
+                self._get_assigned_to_mapping(
+                    self._get_assignee(assigned_to.id))
+
+            category = getattr(issue, 'category', None)
+
+            if category is not None:
+                self._get_category_mapping(
+                    self._issue_categories[project_id][category.id],
+                    project_id)
+
+    def _save_project(self, project):
         """
         Save issue project in the export dictionary.
 
         :param project: Issue project
-        :param issues_export: Issues export dictionary
+        :return: Project export dictionary
         """
         project_value_mapping = \
             self._get_project_mapping(self._projects[project.id])
 
-        projects = issues_export.setdefault('projects', [])
-
         try:
-            project = next((project for project in projects
-                            if project['key'] == project_value_mapping))
-        except StopIteration:
-            project = {'key': project_value_mapping, 'issues': []}
-            projects.append(project)
+            project = self._project_exports[project_value_mapping]
+        except KeyError:
+            project = {'key': project_value_mapping}
+            self._project_exports[project_value_mapping] = project
 
         return project
 
+    def _spool_issue(self, issue_export, project_export):
+        """
+        Serialize a single issue export dictionary to the temporary file
+        holding the exported issues, recording its offset and length among
+        the issues of its parent project.
+
+        :param issue_export: Single issue export dictionary
+        :param project_export: Parent project export dictionary
+        """
+        serialized_issue = json.dumps(issue_export).encode('utf-8')
+
+        self._project_issues_spans.setdefault(project_export['key'], []) \
+            .append((self._issues_spool.tell(), len(serialized_issue)))
+        self._issues_spool.write(serialized_issue)
+
+    def _write_export(self, output):
+        """
+        Write the whole export to the output JSON file, appending to each
+        project the issues spooled while exporting them.
+
+        :param output: File-like object to write the JSON export to
+        """
+        output.write('{"projects": [')
+
+        for index, project_export in \
+                enumerate(self._project_exports.values()):
+            if index > 0:
+                output.write(', ')
+
+            # Leave the project JSON object open
+            # to append the issues array to it
+            output.write(json.dumps(project_export)[:-1])
+            output.write(', "issues": [')
+
+            for issue_index, (offset, length) in enumerate(
+                    self._project_issues_spans.pop(
+                        project_export['key'], [])):
+                if issue_index > 0:
+                    output.write(', ')
+
+                self._issues_spool.seek(offset)
+                output.write(
+                    self._issues_spool.read(length).decode('utf-8'))
+
+            output.write(']}')
+
+        output.write(']}')
+
     def _get_project_mapping(self, project):
         """
         Get the Jira value mapping for the project field.
@@ -430,16 +782,15 @@ class IssuesExporter(object):
         issue_export['description'] = \
             self._get_description_mapping(description)
 
-    @staticmethod
-    def _get_description_mapping(description):
+    def _get_description_mapping(self, description):
         """
         Get the Jira value mapping for the description field.
 
         :param description: Issue description
         :return: Jira value mapping for the description
         """
-        if config.REDMINE_TEXT_FORMATTING != 'none':
-            description = text2confluence_wiki(description)
+        if self._text_formatting_enabled:
+            description = self._text2confluence_wiki(description)
 
         return description
 
@@ -455,17 +806,8 @@ class IssuesExporter(object):
                             either to a user or a group
         :param issue_export: Single issue export dictionary
         """
-        # If the assignee is a group...
-        if config.ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS and \
-           assigned_to.id in self._groups:
-            assigned_to = \
-                self._get_assigned_to_mapping(self._groups[assigned_to.id])
-        # ...else if the assignee is a user...
-        else:
-            assigned_to = \
-                self._get_assigned_to_mapping(self._users[assigned_to.id])
-
-        issue_export['assignee'] = assigned_to
+        issue_export['assignee'] = \
+            self._get_assigned_to_mapping(self._get_assignee(assigned_to.id))
 
     def _get_assigned_to_mapping(self, assigned_to):
         """
@@ -491,9 +833,15 @@ class IssuesExporter(object):
                 self._issue_categories[project_id][category.id], project_id)
 
         if category_resource_type_mapping.jira == models.JiraProjectComponent:
-            # Add component to parent project export dictionary
-            project_export.setdefault('components', []) \
-                          .append(category_value_mapping)
+            # Add component to parent project export dictionary,
+            # unless already added while exporting a previous issue
+            project_components = self._project_components.setdefault(
+                project_export['key'], set())
+
+            if category_value_mapping not in project_components:
+                project_components.add(category_value_mapping)
+                project_export.setdefault('components', []) \
+                              .append(category_value_mapping)
             # Add component to issue export dictionary
             issue_export.setdefault('components', []) \
                         .append(category_value_mapping)
@@ -532,10 +880,36 @@ class IssuesExporter(object):
         """
         Get the Jira value mapping for the estimated hours field.
 
+        The estimated hours are converted to an ISO 8601 duration
+        made up of hours, minutes and seconds only, e.g. ``PT30H15M``.
+
         :param estimated_hours: Issue estimated hours
         :return: Jira value mapping for the estimated hours
         """
-        return duration_isoformat(timedelta(hours=estimated_hours))
+        # Split the duration using integer microseconds
+        # to avoid floating point rounding errors
+        minutes, microseconds = divmod(
+            int(round(estimated_hours * 3600 * 10 ** 6)), 60 * 10 ** 6)
+        hours, minutes = divmod(minutes, 60)
+        seconds, microseconds = divmod(microseconds, 10 ** 6)
+
+        duration = 'PT'
+
+        if hours:
+            duration += '{:d}H'.format(hours)
+
+        if minutes:
+            duration += '{:d}M'.format(minutes)
+
+        if seconds or microseconds or duration == 'PT':
+            duration += '{:d}'.format(seconds)
+
+            if microseconds:
+                duration += '.{:06d}'.format(microseconds).rstrip('0')
+
+            duration += 'S'
+
+        return duration
 
     def _save_custom_fields(self, custom_fields, project_id, issue_export):
         """
@@ -545,30 +919,18 @@ class IssuesExporter(object):
         :param project_id: ID of the project the issue belongs to
         :param issue_export: Single issue export dictionary
         """
-        for custom_field in custom_fields:
-            custom_field_def = self._issue_custom_fields[custom_field.id]
-
-            field_name = self._get_custom_field_mapping(custom_field)
-
-            format_mapping = ISSUE_CUSTOM_FIELD_TYPE_MAPPINGS[
-                custom_field_def.field_format]
-
-            field_type = \
-                format_mapping['multiple'] \
-                if getattr(custom_field_def, 'multiple', False) \
-                else format_mapping['single']
-
-            value = self._get_custom_field_value_mapping(custom_field,
-                                                         project_id)
-
-            custom_field_dict = {
-                'fieldName': field_name,
-                'fieldType': field_type,
-                'value': value
+        custom_fields_export = [
+            {
+                'fieldName': self._get_custom_field_mapping(custom_field),
+                'fieldType': self._issue_custom_field_types[custom_field.id],
+                'value': self._get_custom_field_value_mapping(custom_field,
+                                                              project_id)
             }
+            for custom_field in custom_fields
+        ]
 
-            issue_export.setdefault('customFieldValues', []) \
-                        .append(custom_field_dict)
+        if custom_fields_export:
+            issue_export['customFieldValues'] = custom_fields_export
 
     def _get_custom_field_mapping(self, custom_field):
         """
@@ -609,7 +971,7 @@ class IssuesExporter(object):
             elif custom_field_def.field_format == 'int':
                 jira_value = int(redmine_value)
             elif custom_field_def.field_format in ['text', 'string']:
-                if config.REDMINE_TEXT_FORMATTING != 'none':
+                if self._text_formatting_enabled:
                     # Here we should check also if text formatting is enabled
                     # at custom field level via the "Text Formatting" option.
                     # Unfortunately the current version of Redmine REST API
@@ -617,15 +979,15 @@ class IssuesExporter(object):
                     # Therefore we make the assumption that if the Redmine
                     # administrator enabled the text formatting at system
                     # level, he did it for text custom fields as well.
-                    jira_value = text2confluence_wiki(redmine_value)
+                    jira_value = self._text2confluence_wiki(redmine_value)
             elif custom_field_def.field_format == 'user':
-                if getattr(custom_field_def, 'multiple', False):
-                    user_ids = set(map(int, redmine_value))
+                if custom_field.id in self._multiple_issue_custom_fields:
                     jira_value = [
                         self._get_resource_mapping(
-                            user, include_internal_id=include_internal_id)
-                        for user_id, user in self._users.items()
-                        if user_id in user_ids
+                            self._users[user_id],
+                            include_internal_id=include_internal_id)
+                        for user_id in map(int, redmine_value)
+                        if user_id in self._users
                     ]
                 else:
                     user_id = int(redmine_value)
@@ -633,13 +995,12 @@ class IssuesExporter(object):
                         self._users[user_id],
                         include_internal_id=include_internal_id)
             elif custom_field_def.field_format == 'version':
-                if getattr(custom_field_def, 'multiple', False):
-                    version_ids = set(map(int, redmine_value))
+                if custom_field.id in self._multiple_issue_custom_fields:
+                    versions = self._versions[project_id]
                     jira_value = [
-                        self._get_resource_mapping(version)
-                        for version_id, version in
-                        self._versions[project_id].items()
-                        if version_id in version_ids
+                        self._get_resource_mapping(versions[version_id])
+                        for version_id in map(int, redmine_value)
+                        if version_id in versions
                     ]
                 else:
                     version_id = int(redmine_value)
@@ -661,11 +1022,15 @@ class IssuesExporter(object):
         :param watchers: Issue watchers
         :param issue_export: Single issue export dictionary
         """
-        for watcher in watchers:
-            user = self._get_resource_mapping(self._users[watcher.id])
+        users = self._users
+        get_resource_mapping = self._get_resource_mapping
+
+        watchers_export = [
+            get_resource_mapping(users[watcher.id]) for watcher in watchers
+        ]
 
-            issue_export.setdefault('watchers', []) \
-                        .append(user)
+        if watchers_export:
+            issue_export['watchers'] = watchers_export
 
     def _save_attachments(self, attachments, issue_export):
         """
@@ -674,22 +1039,24 @@ class IssuesExporter(object):
         :param attachments: Issue attachments
         :param issue_export: Single issue export dictionary
         """
-        for attachment in attachments:
-            attacher = self._get_resource_mapping(
-                self._users[attachment.author.id])
+        users = self._users
+        get_resource_mapping = self._get_resource_mapping
 
-            attachment_dict = {
+        attachments_export = [
+            {
                 "name": attachment.filename,
-                "attacher": attacher,
+                "attacher": get_resource_mapping(users[attachment.author.id]),
                 "created": attachment.created_on.isoformat(),
                 "uri": attachment.content_url,
                 "description": attachment.description
             }
+            for attachment in attachments
+        ]
 
-            issue_export.setdefault('attachments', []) \
-                        .append(attachment_dict)
+        if attachments_export:
+            issue_export['attachments'] = attachments_export
 
-    def _save_journals(self, issue, issue_export):
+    def _save_journals(self, issue, project_id, issue_export):
         """
         Save issue journals to export dictionary.
 
@@ -716,37 +1083,53 @@ class IssuesExporter(object):
         changes to issue properties, or both.
 
         :param issue: Current issue
+        :param project_id: ID of the project the issue belongs to
         :param issue_export: Single issue export dictionary
         """
+        # Sort issue journals ensuring chronological order
+        journals = sorted(issue.journals, key=attrgetter('created_on'))
+
+        # Nothing to do for issues which have never been updated
+        if not journals:
+            return
+
         # Jira issue history cannot be generated on-the-fly while iterating
         # the Redmine issue journals, because collected journal items have
         # to be further processed at the end of the loop.
         # As the first processing consists in normalizing the journal details
         # items on a per-property basis we initialize a dictionary, before
         # the loop starts, in order to store journal details items by property.
-        journal_details_by_properties = dict()
+        journal_details_by_properties = defaultdict(list)
+
+        # Store the IDs of the issue custom fields, in order to
+        # quickly check journal details referring to custom fields
+        custom_field_ids = {custom_field.id for custom_field
+                            in getattr(issue, 'custom_fields', [])}
 
-        # Iterate through issue journals ensuring chronological order
-        for journal in sorted(issue.journals, key=itemgetter('created_on')):
+        for journal in journals:
             # If there's a user note in the journal item...
             if getattr(journal, 'notes', None):
                 self._save_journal_notes(journal, issue_export)
 
             # If the journal item contains details of changed properties...
             if getattr(journal, 'details', None):
-                self._collect_journal_details(journal, issue.custom_fields,
+                self._collect_journal_details(journal, custom_field_ids,
                                               journal_details_by_properties)
 
+        # Skip further processing if no issue property has ever been changed
+        if not journal_details_by_properties:
+            return
+
         # 1st processing: Coalesce journal details on a per-property basis
         self._coalesce_journal_details(issue, journal_details_by_properties,
-                                       issue.project.id)
+                                       project_id)
 
         # 2nd processing: Rebuild a new list of journals
         #                 from coalesced journal details
         journals_rebuild = \
             self._rebuild_journals(journal_details_by_properties)
 
-        self._save_journal_details(journals_rebuild, issue.project.id,
+        self._save_journal_details(journals_rebuild, project_id,
                                    issue_export)
 
     def _save_journal_notes(self, journal, issue_export):
@@ -760,8 +1143,8 @@ class IssuesExporter(object):
 
         comment_body = journal.notes
 
-        if config.REDMINE_TEXT_FORMATTING != 'none':
-            comment_body = text2confluence_wiki(comment_body)
+        if self._text_formatting_enabled:
+            comment_body = self._text2confluence_wiki(comment_body)
 
         comment_dict = {
             "author": author,
@@ -773,7 +1156,7 @@ class IssuesExporter(object):
                     .append(comment_dict)
 
     @staticmethod
-    def _collect_journal_details(journal, custom_fields,
+    def _collect_journal_details(journal, custom_field_ids,
                                  journal_details_by_properties):
         """
         Collect change events in the journal details and save them
@@ -804,31 +1187,36 @@ class IssuesExporter(object):
         custom fields only.
 
         :param journal: Issue journal item
-        :param custom_fields: Issue custom fields
+        :param custom_field_ids: Set of issue custom field IDs
         :param journal_details_by_properties: Dictionary of all issue
         journal item
                                               details stored by property
         """
-        for detail in (detail for detail in journal.details
-                       if detail['property'] in ['attr', 'cf']):
+        # Journal item properties are shared among all its details
+        user = journal.user
+        created_on = journal.created_on
+
+        for detail in journal.details:
+            property_type = detail['property']
+
+            if property_type not in ('attr', 'cf'):
+                continue
+
             # If the changed property is a custom field...
-            if detail['property'] == 'cf':
+            if property_type == 'cf':
                 # ...we check if the custom field is actually available
                 # among the issue custom fields. If not, we skip the
                 # journal item detail.
                 # The presence of old references to undefined issue
                 # custom fields may occur with some old versions of
                 # Redmine.
-                try:
-                    next((custom_field for custom_field in custom_fields
-                          if custom_field.id == int(detail['name'])))
-                except StopIteration:
+                if int(detail['name']) not in custom_field_ids:
                     continue
 
             journal_detail_dict = {
-                'user': journal.user,
-                'created_on': journal.created_on,
-                'property': detail['property']
+                'user': user,
+                'created_on': created_on,
+                'property': property_type
             }
 
             if 'new_value' in detail:
@@ -837,8 +1225,7 @@ class IssuesExporter(object):
             if 'old_value' in detail:
                 journal_detail_dict['old_value'] = detail['old_value']
 
-            journal_details_by_properties \
-                .setdefault(detail['name'], []) \
+            journal_details_by_properties[detail['name']] \
                 .append(journal_detail_dict)
 
     def _coalesce_journal_details(self, issue, journal_details, project_id):
@@ -854,6 +1241,8 @@ class IssuesExporter(object):
         :param project_id: ID of the project the issue belongs to
         """
 
+        missing = object()
+
         def is_journal_detail_valid(jd):
             # A journal detail is valid if it represents
             # one of the following operations:
@@ -861,22 +1250,27 @@ class IssuesExporter(object):
             # - A value unset
             # - A value replacement
             # and all the values involved are valid...
-            return ('old_value' not in jd and jd.get('new_value', None)) or \
-                   ('new_value' not in jd and jd.get('old_value', None)) or \
-                   ('old_value' in jd and jd['old_value'] is not None and
-                    'new_value' in jd and jd['new_value'] is not None)
+            old_value = jd.get('old_value', missing)
+            new_value = jd.get('new_value', missing)
+
+            if old_value is missing:
+                return new_value is not missing and bool(new_value)
+            elif new_value is missing:
+                return bool(old_value)
+            else:
+                return old_value is not None and new_value is not None
+
+        custom_fields_by_id = {custom_field.id: custom_field
+                               for custom_field
+                               in getattr(issue, 'custom_fields', [])}
 
         for property_name, journal_detail_list in journal_details.items():
             coalesced_journal_detail_list = []
             new_journal_detail = None
 
-            # We iterate the journal detail list in reverse
-            # as the last change for the property,
-            # either it has been set or unset, is always valid.
-            for i, journal_detail in enumerate(reversed(journal_detail_list)):
-                if new_journal_detail is None:
-                    new_journal_detail = journal_detail
-
+            # Lookup the resource instances referenced
+            # by the values of all the journal details
+            for journal_detail in journal_detail_list:
                 for value_type in ['old_value', 'new_value']:
                     if value_type in journal_detail:
                         journal_detail[value_type] = \
@@ -884,47 +1278,56 @@ class IssuesExporter(object):
                                 property_name, journal_detail['property'],
                                 journal_detail[value_type], project_id)
 
-                # Because of a Redmine bug, that generally occurs when
-                # values of both enumeration resources and custom fields of
-                # type 'list' are manipulated, the last value set for an
-                # issue attribute, within the issue history context, does
-                # not refer to any existing value of the related
-                # enumeration.
-                # In that case we need to forcibly replace that wrong
-                # reference in the history with the actual value of the
-                # related attribute in the issue instance.
-                if i == 0 and \
-                   'new_value' in journal_detail and \
-                   journal_detail['new_value'] is None:
-                    current_value = None
-                    current_string_value = None
-
-                    if journal_detail['property'] == 'attr':
-                        if property_name[:-len('_id')] in \
-                           models.RedmineIssue.get_related_fields():
-                            field_name = property_name[:-len('_id')]
-                            current_value = getattr(issue, field_name, None)
-                            field = getattr(models.RedmineIssue, field_name)
-                            identifying_field = \
-                                field.related_resource.get_identifying_field()
-                            current_string_value = getattr(current_value,
-                                                           identifying_field)
-                        else:
-                            field_name = property_name
-                            current_value = getattr(issue, field_name, None)
-                            current_string_value = current_value
-                    elif journal_detail['property'] == 'cf':
-                        with suppress(StopIteration):
-                            current_value = \
-                                next((cf for cf in issue.custom_fields
-                                      if cf.id == int(property_name)))
-                            identifying_field = models.RedmineCustomField \
-                                                      .get_identifying_field()
-                            current_string_value = getattr(current_value,
-                                                           identifying_field)
-
-                    if current_string_value != journal_detail['new_value']:
-                        journal_detail['new_value'] = current_value
+            # Because of a Redmine bug, that generally occurs when
+            # values of both enumeration resources and custom fields of
+            # type 'list' are manipulated, the last value set for an
+            # issue attribute, within the issue history context, does
+            # not refer to any existing value of the related
+            # enumeration.
+            # In that case we need to forcibly replace that wrong
+            # reference in the history with the actual value of the
+            # related attribute in the issue instance.
+            last_journal_detail = journal_detail_list[-1]
+
+            if 'new_value' in last_journal_detail and \
+               last_journal_detail['new_value'] is None:
+                current_value = None
+                current_string_value = None
+
+                if last_journal_detail['property'] == 'attr':
+                    field = REDMINE_ISSUE_FIELDS_BY_ATTRIBUTE_NAME.get(
+                        property_name)
+
+                    if field is not None and field.is_relation:
+                        field_name = field.key
+                        current_value = getattr(issue, field_name, None)
+                        identifying_field = \
+                            field.related_resource.get_identifying_field()
+                        current_string_value = getattr(current_value,
+                                                       identifying_field)
+                    else:
+                        field_name = property_name
+                        current_value = getattr(issue, field_name, None)
+                        current_string_value = current_value
+                elif last_journal_detail['property'] == 'cf':
+                    current_value = custom_fields_by_id.get(
+                        int(property_name))
+
+                    if current_value is not None:
+                        identifying_field = models.RedmineCustomField \
+                                                  .get_identifying_field()
+                        current_string_value = getattr(current_value,
+                                                       identifying_field)
+
+                if current_string_value != last_journal_detail['new_value']:
+                    last_journal_detail['new_value'] = current_value
+
+            # We iterate the journal detail list in reverse
+            # as the last change for the property,
+            # either it has been set or unset, is always valid.
+            for journal_detail in reversed(journal_detail_list):
+                if new_journal_detail is None:
+                    new_journal_detail = journal_detail
 
                 # If in the new journal detail a value has been replaced,
                 # but the old value is not valid...
@@ -991,54 +1394,33 @@ class IssuesExporter(object):
         # If the journal detail property value is a list of values...
         if isinstance(property_value, list):
             # ...try to convert all the string values to integer type
-
-            def try_parse_integer(s):
-                try:
-                    return int(s)
-                except ValueError:
-                    return None
-
-            property_value = [try_parse_integer(resource_id)
-                              for resource_id in property_value]
-
-            # If not all the values are valid integer ID's...
-            if not all(property_value):
-                # ...return the original value as it is
+            try:
+                property_value = [int(resource_id)
+                                  for resource_id in property_value]
+            except (TypeError, ValueError):
+                # If not all the values are valid integer ID's
+                # return the original value as it is
                 return ret
         # ...otherwise...
         else:
             # ...try to convert the string value to integer type
             try:
                 property_value = int(property_value)
-            except ValueError:
+            except (TypeError, ValueError):
                 # If the conversion fails return the original value as it is
                 return ret
 
         # If the property is an attribute...
         if property_type == 'attr':
-            if property_name == 'project_id':
-                ret = self._projects.get(property_value, None)
-            elif property_name == 'tracker_id':
-                ret = self._trackers.get(property_value, None)
-            elif property_name == 'author_id':
-                ret = self._users.get(property_value, None)
-            elif property_name == 'assigned_to_id':
-                ret = self._users.get(property_value, None)
-
-                if ret is None and config.ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS:
-                    ret = self._groups.get(property_value, None)
-            elif property_name == 'status_id':
-                ret = self._issue_statuses.get(property_value, None)
-            elif property_name == 'priority_id':
-                ret = self._issue_priorities.get(property_value, None)
-            elif property_name == 'category_id':
-                ret = self._issue_categories[project_id].get(property_value,
-                                                             None)
-            elif property_name == 'fixed_version_id':
-                ret = self._versions[project_id].get(property_value, None)
+            resolver = \
+                self._journal_detail_attribute_resolvers.get(property_name)
+
+            if resolver is not None:
+                ret = resolver(property_value, project_id)
         # ...else if the property is a custom field...
         elif property_type == 'cf':
-            custom_field_def = self._issue_custom_fields[int(property_name)]
+            custom_field_id = int(property_name)
+            custom_field_def = self._issue_custom_fields[custom_field_id]
 
             if custom_field_def.field_format in ['user', 'version']:
                 resources_dict = None
@@ -1048,7 +1430,7 @@ class IssuesExporter(object):
                 elif custom_field_def.field_format == 'version':
                     resources_dict = self._versions
 
-                if getattr(custom_field_def, 'multiple', False):
+                if custom_field_id in self._multiple_issue_custom_fields:
                     ret = [v for k, v in resources_dict.items()
                            if k in property_value]
                 else:
@@ -1060,6 +1442,28 @@ class IssuesExporter(object):
 
         return ret
 
+    def _get_assignee(self, assignee_id, required=True):
+        """
+        Get the user, or the group if issue assignment to groups is allowed,
+        an issue may be assigned to.
+
+        :param assignee_id: ID of the user or the group
+        :param required: If ``True`` a ``KeyError`` holding the assignee ID
+                         is raised when no user or group is found, otherwise
+                         ``None`` is returned. Default is ``True``.
+        :return: The user or group resource instance
+        """
+        # If the assignee is a group...
+        if config.ALLOW_ISSUE_ASSIGNMENT_TO_GROUPS and \
+           assignee_id in self._groups:
+            return self._groups[assignee_id]
+
+        # ...else the assignee is a user
+        if required:
+            return self._users[assignee_id]
+
+        return self._users.get(assignee_id, None)
+
     @staticmethod
     def _rebuild_journals(journal_details_by_properties):
         """
@@ -1072,29 +1476,32 @@ class IssuesExporter(object):
                                               related to the property
         :return: A new list of journals
         """
-        journals_rebuild = []
+        # Rebuilt journals are indexed by creation date,
+        # preserving the order in which they are created
+        journals_rebuild = OrderedDict()
 
         for prop, details in journal_details_by_properties.items():
             for item in details:
                 try:
-                    journal = \
-                        next((journal for journal in journals_rebuild
-                              if journal['created_on'] == item['created_on']))
-                except StopIteration:
+                    journal = journals_rebuild[item['created_on']]
+                except KeyError:
                     journal = {
                         'user': item['user'],
                         'created_on': item['created_on'],
                         'details': []
                     }
 
-                    journals_rebuild.append(journal)
+                    journals_rebuild[item['created_on']] = journal
 
-                detail = {k: v for d in [item, {'name': prop}]
-                          for k, v in d.items() if k not in journal.keys()}
+                detail = {'name': prop, 'property': item['property']}
+
+                for value_type in ('old_value', 'new_value'):
+                    if value_type in item:
+                        detail[value_type] = item[value_type]
 
                 journal['details'].append(detail)
 
-        return journals_rebuild
+        return list(journals_rebuild.values())
 
     def _save_journal_details(self, journals, project_id, issue_export):
         """
@@ -1105,17 +1512,24 @@ class IssuesExporter(object):
         :param issue_export: Single issue export dictionary
         """
 
-        def sort_type(j):
-            if j['property'] == 'attr':
-                return 0
-            elif j['property'] == 'cf':
-                return 1
+        def sort_key(jd):
+            return jd['name'], JOURNAL_DETAIL_PROPERTY_TYPES_ORDER[
+                jd['property']]
+
+        # History events indexed by creation date
+        events_by_created = {event['created']: event
+                             for event in issue_export.get('history', [])}
 
         # Iterate normalized journals in chronological order
         for journal in sorted(journals, key=itemgetter('created_on')):
             # Sort journal details by name and type (attribute / custom field)
-            for detail in sorted(sorted(journal['details'], key=sort_type),
-                                 key=itemgetter('name')):
+            for detail in sorted(journal['details'], key=sort_key):
+                # Skip changes of issue attributes that cannot be
+                # exported, without mapping their values at all
+                if detail['property'] == 'attr' and \
+                   detail['name'] in UNMAPPED_REDMINE_ISSUE_ATTRIBUTE_NAMES:
+                    continue
+
                 field, field_type = None, None
                 from_internal_value, from_string = None, None
                 to_internal_value, to_string = None, None
@@ -1126,14 +1540,13 @@ class IssuesExporter(object):
 
                     if detail['property'] == 'attr':
                         field_type = 'jira'
-                        field, internal_value, string_value = \
-                            self._get_journal_detail_field_mapping(
-                                detail['name'], detail[value_type], project_id)
                     elif detail['property'] == 'cf':
                         field_type = 'custom'
-                        field, internal_value, string_value = \
-                            self._get_journal_detail_custom_field_mapping(
-                                detail['name'], detail[value_type], project_id)
+
+                    field, internal_value, string_value = \
+                        self._get_journal_detail_mapping(
+                            detail['property'], detail['name'],
+                            detail[value_type], project_id)
 
                     if internal_value is not None and string_value is None:
                         string_value = ""
@@ -1153,13 +1566,10 @@ class IssuesExporter(object):
                 #       the same Jira value.
                 if field is not None and \
                    from_internal_value != to_internal_value:
-                    history = issue_export.setdefault('history', [])
                     created = journal['created_on'].isoformat()
+                    event = events_by_created.get(created)
 
-                    try:
-                        event = next((event for event in history
-                                      if event['created'] == created))
-                    except StopIteration:
+                    if event is None:
                         author = self._get_resource_mapping(
                             self._users[journal['user'].id])
 
@@ -1169,7 +1579,8 @@ class IssuesExporter(object):
                             'items': []
                         }
 
-                        history.append(event)
+                        issue_export.setdefault('history', []).append(event)
+                        events_by_created[created] = event
 
                     item = {
                         'field': field,
@@ -1182,6 +1593,63 @@ class IssuesExporter(object):
 
                     event['items'].append(item)
 
+    def _get_journal_detail_mapping(self, property_type, redmine_field,
+                                    redmine_value, project_id):
+        """
+        Get the Jira field mapping of a journal detail referenced field
+        or custom field, depending on the journal detail property type.
+
+        As values referring to issue related resources recur across the
+        journals of several issues, e.g. issue status transitions, their
+        mappings are computed only once for each value. Values of simple
+        fields, e.g. subject and description, are nearly always unique,
+        hence their mappings are computed each time.
+
+        While the resource value mappings are already cached by resource
+        instance, this cache also saves the resolution of the journal
+        detail value to the resource instance, the lookup of the Jira field
+        and, for multi-valued custom fields, the mapping of each value.
+
+        :param property_type: The type of the journal detail property.
+                              May be one of ``attr`` (attribute) or ``cf``
+                              (custom field).
+        :param redmine_field: Redmine field or custom field name
+        :param redmine_value: Redmine value
+        :param project_id: ID of the project the issue belongs to
+        :return: The Jira field mapping, as a 3-elements tuple
+        """
+        if property_type == 'attr':
+            get_mapping = self._get_journal_detail_field_mapping
+            is_resource_value = \
+                redmine_field in self._journal_detail_attribute_resolvers
+        elif property_type == 'cf':
+            get_mapping = self._get_journal_detail_custom_field_mapping
+            is_resource_value = \
+                self._issue_custom_fields[int(redmine_field)].field_format \
+                in ['user', 'version']
+        else:
+            raise NotImplementedError(
+                "The property type '{}' of a journal detail is not supported!"
+                .format(property_type))
+
+        if not is_resource_value:
+            return get_mapping(redmine_field, redmine_value, project_id)
+
+        cache_key = (property_type, redmine_field,
+                     tuple(redmine_value)
+                     if isinstance(redmine_value, list) else redmine_value,
+                     project_id)
+
+        try:
+            return self._journal_detail_mappings_cache[cache_key]
+        except KeyError:
+            pass
+
+        mapping = get_mapping(redmine_field, redmine_value, project_id)
+        self._journal_detail_mappings_cache[cache_key] = mapping
+
+        return mapping
+
     def _get_journal_detail_field_mapping(self, redmine_field, redmine_value,
                                           project_id):
         """
@@ -1205,9 +1673,16 @@ class IssuesExporter(object):
                  The returned object is a 3-elements tuples in both cases,
                  as the third element for standard field is set to ``None``.
         """
+        try:
+            redmine_field_def = \
+                REDMINE_ISSUE_FIELDS_BY_ATTRIBUTE_NAME[redmine_field]
+        except KeyError:
+            raise NotImplementedError(
+                "The field '{}' in a journal detail is not supported!"
+                .format(redmine_field))
+
         # If it's an issue related resource field...
-        if redmine_field[:-len('_id')] in \
-           models.RedmineIssue.get_related_fields():
+        if redmine_field_def.is_relation:
             resource_type = None
             project_id_local = None
 
@@ -1224,22 +1699,20 @@ class IssuesExporter(object):
                     include_type_mapping=True,
                     include_internal_id=True)
 
-            redmine_field_def = getattr(models.RedmineIssue,
-                                        redmine_field[:-len('_id')])
             jira_field_def = ISSUE_FIELD_MAPPINGS[(redmine_field_def,
                                                    resource_type_mapping)]
             jira_internal_value, jira_string_value = resource_value_mapping
             jira_internal_value = str(jira_internal_value)
         # ...else if it's a Redmine standard field...
         else:
-            redmine_field_def = getattr(models.RedmineIssue, redmine_field)
             jira_field_def = ISSUE_FIELD_MAPPINGS[redmine_field_def]
             jira_string_value = None
 
             if redmine_field == 'subject':
                 jira_internal_value = redmine_value
             elif redmine_field == 'description':
-                jira_internal_value = text2confluence_wiki(redmine_value)
+                jira_internal_value = \
+                    self._text2confluence_wiki(redmine_value)
             elif redmine_field in ['created_on', 'updated_on',
                                    'start_date', 'due_date']:
                 jira_internal_value = \
@@ -1298,7 +1771,7 @@ class IssuesExporter(object):
             custom_field, resource_type=models.RedmineCustomField)
 
         if custom_field_def.field_format in ['user', 'version']:
-            if getattr(custom_field_def, 'multiple', False):
+            if custom_field_id in self._multiple_issue_custom_fields:
                 internal_value, string_value = \
                     zip(*self._get_custom_field_value_mapping(
                         custom_field, project_id, include_internal_id=True))
@@ -1378,12 +1851,48 @@ class IssuesExporter(object):
         redmine_resource_type = resource_type
 
         if not redmine_resource_type:
-            redmine_resource_type = \
-                eval('models.Redmine' + resource.__class__.__name__)
+            redmine_resource_type = REDMINE_RESOURCE_TYPES_BY_CLASS_NAME[
+                resource.__class__.__name__]
 
-        humanized_redmine_resource_type = \
-            humanize(underscore(redmine_resource_type.__name__))
+        # As value mappings never change within the same session,
+        # each resource instance needs to be mapped only once.
+        cache_key = (redmine_resource_type, resource.id, project_id)
 
+        try:
+            jira_resource_value, resource_type_mapping = \
+                self._resource_mappings_cache[cache_key]
+        except KeyError:
+            jira_resource_value, resource_type_mapping = \
+                self._get_jira_resource_value_mapping(
+                    resource, redmine_resource_type, project_id)
+
+            self._resource_mappings_cache[cache_key] = \
+                (jira_resource_value, resource_type_mapping)
+
+        if config.EXPORT_ISSUE_JOURNALS and not include_internal_id:
+            jira_resource_value = jira_resource_value[1]
+
+        if include_type_mapping:
+            return jira_resource_value, resource_type_mapping
+        else:
+            return jira_resource_value
+
+    def _get_jira_resource_value_mapping(self, resource,
+                                         redmine_resource_type, project_id):
+        """
+        Find the Jira resource value mapped to a Redmine resource instance,
+        looking for static value mappings first, then for dynamic ones,
+        and finally prompting the final user to define a new one.
+
+        :param resource: Resource instance
+        :param redmine_resource_type: Internal Redmine resource type class
+        :param project_id: ID of the project the resource value is bound to,
+                           if any.
+        :return: A tuple containing both the mapped Jira resource value,
+                 paired with its internal ID if the issue journals export
+                 feature is enabled, and the related ``ResourceTypeMapping``
+                 object
+        """
         jira_resource_type = None
         resource_type_mapping = None
         redmine_resource_value = None
@@ -1391,23 +1900,30 @@ class IssuesExporter(object):
         field_mapping = None
 
         jira_resource_type_field_mappings = \
-            {k.jira: v
-             for k, v in RESOURCE_TYPE_IDENTIFYING_FIELD_MAPPINGS.items()
-             if k.redmine == redmine_resource_type}
-
-        # Search for a statically user-defined value mapping
-        for jira_resource_type, field_mapping in \
+            IDENTIFYING_FIELD_MAPPINGS_BY_REDMINE_RESOURCE_TYPE.get(
+                redmine_resource_type, {})
+
+        project_identifier = None
+
+        if project_id is not None:
+            # Use project identifier instead of its internal ID
+            # to fetch per-project resource value mappings inside
+            # user-defined configuration files.
+            project_identifier = self._projects[project_id].identifier
+
+        resource_value_mappings = self._resource_value_mappings
+
+        # Search for a statically user-defined value mapping first,
+        # then for a dynamically user-defined one, for each Jira
+        # resource type in turn.
+        #
+        # NOTE: Checking both kinds of value mappings within the same
+        #       Jira resource type is safe, as a dynamic value mapping
+        #       is only ever defined for a Redmine resource value which
+        #       misses a static value mapping for all the Jira resource
+        #       types, and static value mappings never change.
+        for jira_resource_type, (resource_type_mapping, field_mapping) in \
                 jira_resource_type_field_mappings.items():
-            # Build ResourceTypeMapping object
-            resource_type_mapping = ResourceTypeMapping(redmine_resource_type,
-                                                        jira_resource_type)
-
-            # Dynamically compose resource type mapping setting name
-            resource_type_mapping_setting_name = \
-                '{}_{}_MAPPINGS'.format(
-                    underscore(redmine_resource_type.__name__).upper(),
-                    underscore(jira_resource_type.__name__).upper())
-
             # Get the Redmine resource value
             redmine_resource_value = \
                 getattr(resource, field_mapping.redmine.key)
@@ -1415,91 +1931,75 @@ class IssuesExporter(object):
             # Try to get the Jira resource value from mappings
             # statically defined in configuration settings
             static_resource_value_mappings = \
-                getattr(config, resource_type_mapping_setting_name, {})
-
-            if project_id is not None:
-                # Use project identifier instead of its internal ID
-                # to fetch per-project resource value mappings inside
-                # user-defined configuration files.
-                project_identifier = self._projects[project_id].identifier
-                static_resource_value_mappings = \
-                    static_resource_value_mappings.get(project_identifier, {})
-
-            jira_resource_value = \
-                static_resource_value_mappings.get(
-                    redmine_resource_value, None)
+                self._get_static_resource_value_mappings(
+                    resource_type_mapping, project_identifier)
 
-            if jira_resource_value is not None:
-                # A Jira resource value mapping has been found. Exit!
-                break
+            if static_resource_value_mappings:
+                try:
+                    jira_resource_value = \
+                        static_resource_value_mappings[redmine_resource_value]
+                except KeyError:
+                    jira_resource_value = None
 
-        if jira_resource_value is None:
-            # Search for a dynamically user-defined value mapping
-            for jira_resource_type, field_mapping in \
-                    jira_resource_type_field_mappings.items():
-                # Build ResourceTypeMapping object
-                resource_type_mapping = \
-                    ResourceTypeMapping(redmine_resource_type,
-                                        jira_resource_type)
-
-                # Get the Redmine resource value
-                redmine_resource_value = getattr(resource,
-                                                 field_mapping.redmine.key)
-
-                # Try to get the Jira resource value from mappings
-                # dynamically defined at runtime
+            # Unless none has been defined yet, try to get the Jira
+            # resource value from mappings dynamically defined at runtime
+            if jira_resource_value is None and resource_value_mappings:
                 if project_id is None:
-                    jira_resource_value = \
-                        self._resource_value_mappings.get(
-                            (redmine_resource_value, resource_type_mapping),
-                            None)
+                    dynamic_mapping_key = (redmine_resource_value,
+                                           resource_type_mapping)
                 else:
+                    dynamic_mapping_key = (project_id,
+                                           redmine_resource_value,
+                                           resource_type_mapping)
+
+                try:
                     jira_resource_value = \
-                        self._resource_value_mappings.get(
-                            (project_id,
-                             redmine_resource_value, resource_type_mapping),
-                            None)
+                        resource_value_mappings[dynamic_mapping_key]
+                except KeyError:
+                    jira_resource_value = None
 
-                if jira_resource_value is not None:
-                    # A Jira resource value mapping has been found. Exit!
-                    break
+            if jira_resource_value is not None:
+                # A Jira resource value mapping has been found. Exit!
+                break
 
         if jira_resource_value is None:
             # No value mapping found!
+            humanized_redmine_resource_type = \
+                humanize_resource_type(redmine_resource_type)
 
             # If there not exist dynamically user-defined value mappings...
-            if not self._resource_value_mappings:
-                click.echo()
-                click.echo("-" * len(MISSING_RESOURCE_MAPPINGS_MESSAGE))
-                click.echo(MISSING_RESOURCE_MAPPINGS_MESSAGE)
-                click.echo("-" * len(MISSING_RESOURCE_MAPPINGS_MESSAGE))
+            if not resource_value_mappings:
+                click.echo(MISSING_RESOURCE_MAPPINGS_HEADER)
 
             # If the Redmine resource type can be mapped
             # to more than one Jira resource types...
             if len(jira_resource_type_field_mappings.keys()) > 1:
                 # ...prompt user to choose one
-                click.echo(
-                    "Missing value mapping for {} '{}'."
-                    .format(humanized_redmine_resource_type,
-                            redmine_resource_value))
-                click.echo("A {} can be mapped with one of the "
-                           "following Jira resource types:"
-                           .format(humanized_redmine_resource_type))
-                click.echo()
-
                 static_jira_resource_type_choices = \
-                    {i + 1: jrt for i, jrt in
-                     enumerate(jira_resource_type_field_mappings)}
+                    list(jira_resource_type_field_mappings)
 
-                for k, v in static_jira_resource_type_choices.items():
+                # The whole message is echoed at once
+                message_lines = [
+                    "Missing value mapping for {} '{}'."
+                    .format(humanized_redmine_resource_type,
+                            redmine_resource_value),
+                    "A {} can be mapped with one of the "
+                    "following Jira resource types:"
+                    .format(humanized_redmine_resource_type),
+                    ""
+                ]
+
+                for k, v in enumerate(static_jira_resource_type_choices, 1):
                     # Strip 'Jira' prefix from class name
                     humanized_jira_resource_type = \
-                        humanize(underscore(v.__name__[len('Jira'):]))
+                        humanize_resource_type(v, prefix='Jira')
+
+                    message_lines.append(
+                        "{:d}) {}".format(k, humanized_jira_resource_type))
 
-                    click.echo("{:d}) {}"
-                               .format(k, humanized_jira_resource_type))
+                message_lines.append("")
 
-                click.echo()
+                click.echo("\n".join(message_lines))
 
                 choice = click.prompt(
                     "Choose a target Jira resource type",
@@ -1507,25 +2007,18 @@ class IssuesExporter(object):
                     type=click.IntRange(
                         1, len(static_jira_resource_type_choices)))
 
-                jira_resource_type = static_jira_resource_type_choices[choice]
+                jira_resource_type = \
+                    static_jira_resource_type_choices[choice - 1]
 
             click.echo()
 
             humanized_jira_resource_type = \
-                humanize(underscore(jira_resource_type.__name__))
+                humanize_resource_type(jira_resource_type)
 
             value_proc = None
 
             if config.EXPORT_ISSUE_JOURNALS:
                 # Force usage of '{ID}:{unique_name}' form
-                def parse_id_unique_name(value):
-                    try:
-                        return models.ResourceKey._make(value.split(':'))  # noqa
-                    except TypeError:
-                        raise UsageError(
-                            "The mapping has to be expressed using the "
-                            "{ID}:{identifying_name} form!")
-
                 value_proc = parse_id_unique_name
 
             jira_resource_value = click.prompt(
@@ -1540,23 +2033,73 @@ class IssuesExporter(object):
                 prompt_suffix=MISSING_RESOURCE_MAPPING_PROMPT_SUFFIX,
                 value_proc=value_proc)
 
-            resource_type_mapping = ResourceTypeMapping(redmine_resource_type,
-                                                        jira_resource_type)
+            resource_type_mapping = \
+                jira_resource_type_field_mappings[jira_resource_type][0]
 
             if project_id is None:
-                self._resource_value_mappings[
+                resource_value_mappings[
                     (redmine_resource_value,
                      resource_type_mapping)] = jira_resource_value
             else:
-                self._resource_value_mappings[
+                resource_value_mappings[
                     (project_id,
                      redmine_resource_value,
                      resource_type_mapping)] = jira_resource_value
 
-        if config.EXPORT_ISSUE_JOURNALS and not include_internal_id:
-            jira_resource_value = jira_resource_value[1]
+        return jira_resource_value, resource_type_mapping
 
-        if include_type_mapping:
-            return jira_resource_value, resource_type_mapping
-        else:
-            return jira_resource_value
+    def _get_static_resource_value_mappings(self, resource_type_mapping,
+                                            project_identifier=None):
+        """
+        Get the resource value mappings statically defined in configuration
+        settings for a resource type mapping and, if the mappings are
+        defined on a per-project basis, for a project.
+
+        :param resource_type_mapping: ``ResourceTypeMapping`` object
+        :param project_identifier: Identifier of the project the resource
+                                   value mappings are bound to, if any
+        :return: Dictionary of static resource value mappings
+        """
+        cache_key = (resource_type_mapping, project_identifier)
+
+        try:
+            return self._static_resource_value_mappings[cache_key]
+        except KeyError:
+            pass
+
+        static_resource_value_mappings = getattr(
+            config, RESOURCE_TYPE_MAPPING_SETTING_NAMES[resource_type_mapping],
+            {})
+
+        if project_identifier is not None:
+            static_resource_value_mappings = \
+                static_resource_value_mappings.get(project_identifier, {})
+
+        self._static_resource_value_mappings[cache_key] = \
+            static_resource_value_mappings
+
+        return static_resource_value_mappings
+
+    def _text2confluence_wiki(self, text):
+        """
+        Convert a Redmine resource text content to Confluence Wiki notation,
+        reusing the result of a previous conversion of the same text, if any.
+
+        :param text: Plain text or formatted text using Textile or Markdown
+                     markup languages
+        :return: Text in Confluence Wiki notation
+        """
+        try:
+            return self._text_conversions_cache[text]
+        except KeyError:
+            pass
+
+        # Keep memory usage bounded by simply starting over
+        # once the cache is full
+        if len(self._text_conversions_cache) >= TEXT_CONVERSIONS_CACHE_SIZE:
+            self._text_conversions_cache.clear()
+
+        confluence_wiki = text2confluence_wiki(text)
+        self._text_conversions_cache[text] = confluence_wiki
+
+        return confluence_wiki
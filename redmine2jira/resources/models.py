@@ -12,6 +12,9 @@ FakeResourceInstance = namedtuple('FakeResourceInstance',
 
 
 class Field(object):
+    __slots__ = ('key', 'name', 'identifying', 'related_resource',
+                 'is_relation')
+
     def __init__(self, key, name, identifying=False, related_resource=None):
         self.key = key
         self.name = name
@@ -31,9 +34,16 @@ class ResourceType(object):
 
     @classmethod
     def get_identifying_field(cls):
-        return next((field for field in cls.__dict__
-                     if isinstance(getattr(cls, field), Field) and
-                     getattr(cls, field).identifying), None)
+        # As resource type fields never change, the identifying field
+        # is looked up only once per class and stored in the class
+        # dictionary itself.
+        if '_identifying_field' not in cls.__dict__:
+            cls._identifying_field = next(
+                (field for field in cls.__dict__
+                 if isinstance(getattr(cls, field), Field) and
+                 getattr(cls, field).identifying), None)
+
+        return cls._identifying_field
 
 
 # Redmine resource types
@@ -5,13 +5,17 @@
 from __future__ import absolute_import
 
 from contextlib import closing
-from io import StringIO
 
 from lxml import etree as et
 
 from redmine2jira import config
 
 
+# XSL transformation from XHTML to Confluence Wiki notation,
+# compiled the first time it is needed and then reused.
+_xhtml2confluence_wiki_transform = None
+
+
 def text2confluence_wiki(text):
     """
     Convert a Redmine resource text content to Confluence Wiki notation.
@@ -45,17 +49,31 @@ def xhtml2confluence_wiki(xhtml):
     :param xhtml: UTF-8 encoded XHTML 1.x fragment
     :return: Confluence Wiki fragment
     """
-    from pkg_resources import resource_stream
-
-    with closing(StringIO()) as xml:
-        xml.write('<body xmlns="http://www.w3.org/1999/xhtml">\n')
-        xml.write(xhtml)
-        xml.write('\n</body>')
-        xml_string = xml.getvalue()
-        dom = et.fromstring(xml_string)
-        xsl_stream = resource_stream(__name__, 'rte-xhtml2wiki.xsl')
-        xsl = et.parse(xsl_stream)
-        transform = et.XSLT(xsl)
-        confluence_wiki = str(transform(dom), encoding='utf-8')
+    dom = et.fromstring('<body xmlns="http://www.w3.org/1999/xhtml">\n' +
+                        xhtml +
+                        '\n</body>')
+    transform = _get_xhtml2confluence_wiki_transform()
+    confluence_wiki = str(transform(dom), encoding='utf-8')
 
     return confluence_wiki
+
+
+def _get_xhtml2confluence_wiki_transform():
+    """
+    Get the XSL transformation from XHTML to Confluence Wiki notation,
+    parsing and compiling the stylesheet only the first time.
+
+    :return: XSLT object
+    """
+    global _xhtml2confluence_wiki_transform
+
+    if _xhtml2confluence_wiki_transform is None:
+        from pkg_resources import resource_stream
+
+        with closing(resource_stream(__name__,
+                                     'rte-xhtml2wiki.xsl')) as xsl_stream:
+            xsl = et.parse(xsl_stream)
+
+        _xhtml2confluence_wiki_transform = et.XSLT(xsl)
+
+    return _xhtml2confluence_wiki_transform
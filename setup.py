@@ -17,7 +17,6 @@ requirements = [
     'contextlib2>=0.6',
     'future>=0.16.0',
     'inflection>=0.3',
-    'isodate>=0.6',
     'lxml>=4.1',
     'markdown>=2.6',
     'Pillow>=5.0',
@@ -4,10 +4,17 @@
 """Tests for `redmine2jira` package."""
 
 
+import json
+import tempfile
 import unittest
+
+from collections import OrderedDict
+
 from click.testing import CliRunner
+from six import StringIO
 
 from redmine2jira import cli
+from redmine2jira.exporters.issues import IssuesExporter
 
 
 class TestRedmine2Jira(unittest.TestCase):
@@ -32,3 +39,78 @@ class TestRedmine2Jira(unittest.TestCase):
         help_result = runner.invoke(cli.main, ['--help'])
         assert help_result.exit_code == 0
         assert '--help  Show this message and exit.' in help_result.output
+
+
+class TestIssuesExporter(unittest.TestCase):
+    """Tests for `redmine2jira.exporters.issues` module."""
+
+    def setUp(self):
+        """Set up an exporter ready to spool issues, without Redmine."""
+        self.exporter = IssuesExporter.__new__(IssuesExporter)
+        self.exporter._project_exports = OrderedDict()
+        self.exporter._issues_spool = tempfile.TemporaryFile()
+        self.exporter._project_issues_spans = dict()
+
+    def tearDown(self):
+        """Close the exporter issues spool."""
+        self.exporter._issues_spool.close()
+
+    def _export(self, spooled_issues):
+        """
+        Spool issues in the given order, then write the whole export.
+
+        :param spooled_issues: Sequence of (project key, issues) pairs,
+                               where the same key may occur more than once
+        :return: The parsed JSON export
+        """
+        for key, issues in spooled_issues:
+            project_export = self.exporter._project_exports.setdefault(
+                key, {'key': key, 'components': ['Core']})
+
+            for issue_export in issues:
+                self.exporter._spool_issue(issue_export, project_export)
+
+        output = StringIO()
+        self.exporter._write_export(output)
+
+        return json.loads(output.getvalue())
+
+    def test_write_export(self):
+        """Test the spooled issues are appended to their projects."""
+        first_issues = [{'externalId': '1', 'summary': u'Caf\xe9'},
+                        {'externalId': '3', 'summary': 'Third'}]
+        second_issues = [{'externalId': '2', 'summary': 'Second'}]
+
+        # Spool the issues of both projects interleaved
+        export = self._export([('FIRST', first_issues[:1]),
+                               ('SECOND', second_issues),
+                               ('FIRST', first_issues[1:])])
+
+        assert export == {'projects': [
+            {'key': 'FIRST', 'components': ['Core'], 'issues': first_issues},
+            {'key': 'SECOND', 'components': ['Core'], 'issues': second_issues}
+        ]}
+
+    def test_write_export_without_projects(self):
+        """Test an export without projects is well-formed."""
+        assert self._export([]) == {'projects': []}
+
+    def test_write_export_without_issues(self):
+        """Test a project without issues is well-formed."""
+        assert self._export([('EMPTY', [])]) == {'projects': [
+            {'key': 'EMPTY', 'components': ['Core'], 'issues': []}
+        ]}
+
+    def test_get_estimated_hours_mapping(self):
+        """Test estimated hours are mapped to ISO 8601 durations."""
+        get_mapping = IssuesExporter._get_estimated_hours_mapping
+
+        assert get_mapping(1) == 'PT1H'
+        assert get_mapping(30.0) == 'PT30H'
+        assert get_mapping(1.5) == 'PT1H30M'
+        assert get_mapping(0.25) == 'PT15M'
+        assert get_mapping(0) == 'PT0S'
+        assert get_mapping(0.0) == 'PT0S'
+        assert get_mapping(1 + 2.5 / 3600) == 'PT1H2.5S'
+        assert get_mapping(1.0 / 3600 / 1000) == 'PT0.001S'
+        assert get_mapping(1.0 / 3600 / 10 ** 6) == 'PT0.000001S'